@@ -2,7 +2,9 @@
 Generate a PowerPoint from Microsoft Dataverse data using a fixed template.
 
 Dependencies:
-    pip install msal requests python-pptx
+    pip install msal "httpx[http2]" python-pptx
+    pip install orjson    (optional, faster decoding of record content)
+    pip install isal      (optional, faster compression when saving presentations)
 
 Configuration:
     Set the following environment variables:
@@ -15,15 +17,41 @@ Usage:
     python generate_ppt_dataverse.py
 """
 import os
+import io
+import re
+import copy
 import sys
+import time
+import random
+import zlib
+import zipfile
+import threading
+import contextlib
 import msal
-import requests
-import json
+import httpx
+import functools
+import operator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from itertools import repeat
+from lxml import etree
 from pptx import Presentation
+from pptx.oxml.ns import qn
+from pptx.oxml.text import CT_RegularTextRun
 from pptx.util import Inches, Pt
 from dotenv import load_dotenv
 from datetime import datetime
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
+try:
+    from isal import isal_zlib
+except ImportError:
+    isal_zlib = None
+
 # Load environment variables from a .env file
 load_dotenv()
 
@@ -49,6 +77,44 @@ if not all([CLIENT_ID, CLIENT_SECRET, TENANT_ID, DATAVERSE_API_URL, DATAVERSE_UR
 
 SCOPE = [f"{DATAVERSE_URL.strip('/')}/.default"]
 
+# Dataverse throttling responses that are retried, and how many attempts are made per request
+RETRY_STATUS_CODES = (429, 503)
+MAX_REQUEST_ATTEMPTS = 3
+
+# Shared HTTP/2 client so paginated requests reuse a single TLS connection
+_http = httpx.Client(
+    http2=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=4),
+    headers={'Accept': 'application/json'}
+)
+
+# Maximum number of presentations each worker process saves in the background at once
+MAX_PENDING_SAVES = 2
+
+# Font size (pt) used for all generated table cells
+TABLE_FONT_SIZE = 11
+
+# Upper bound on worker processes used to render records in parallel
+MAX_RENDER_WORKERS = min(3, os.cpu_count() or 1)
+
+# Matches {{placeholder}} tags in slide text, capturing the placeholder name
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*([^}\s]+)\s*\}\}")
+
+# Matches a table placeholder cell, {{table:NAME}}, capturing the name of the array to render
+_TABLE_PH_RE = re.compile(r'^\s*\{\{\s*table\s*:\s*([^}\s]+)\s*\}\}\s*$')
+
+# Precompiled XPath queries for harvesting text: paragraphs of top-level text shapes, and the text nodes of their runs
+_XML_NAMESPACES = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+_P_XPATH = etree.XPath('./p:sp/p:txBody/a:p', namespaces=_XML_NAMESPACES)
+_T_XPATH = etree.XPath('./a:r/a:t', namespaces=_XML_NAMESPACES)
+
+# Matches the _xHHHH_ escapes python-pptx writes for XML-illegal control characters
+_CTRL_ESCAPE_RE = re.compile(r'_x(00[01][0-9A-F])_')
+
 
 def get_access_token():
     """Retrieve an OAuth2 access token for Dataverse."""
@@ -65,12 +131,29 @@ def get_access_token():
         raise Exception(f"Token acquisition failed: {result.get('error_description')}")
 
 
+def get_with_retry(url: str, headers: dict, params=None):
+    """GET a Dataverse URL, retrying with jittered backoff when the request is throttled."""
+    for attempt in range(1, MAX_REQUEST_ATTEMPTS + 1):
+        resp = _http.get(url, headers=headers, params=params)
+        if resp.status_code not in RETRY_STATUS_CODES or attempt == MAX_REQUEST_ATTEMPTS:
+            break
+        try:
+            retry_after = float(resp.headers.get('Retry-After', attempt))
+        except ValueError:
+            retry_after = attempt
+        print(f"Request throttled ({resp.status_code}), retrying in {retry_after:.0f}s")
+        time.sleep(retry_after + random.uniform(0, 0.5))
+    resp.raise_for_status()
+    return resp
+
+
 def fetch_data(entity: str, token: str, select=None, filter_expr=None):
-    """Retrieve records from a Dataverse entity."""
-    headers = {
-        'Authorization': f'Bearer {token}',
-        'Accept': 'application/json'
-    }
+    """
+    Retrieve records from a Dataverse entity.
+    Follows @odata.nextLink to yield records from every page. The next page is
+    fetched in the background while the caller consumes the current one.
+    """
+    headers = {'Authorization': f'Bearer {token}'}
     params = {}
     if select:
         params['$select'] = ','.join(select)
@@ -78,59 +161,86 @@ def fetch_data(entity: str, token: str, select=None, filter_expr=None):
         params['$filter'] = filter_expr
 
     url = f"{DATAVERSE_API_URL.rstrip('/')}/{entity}"
-    resp = requests.get(url, headers=headers, params=params)
-    resp.raise_for_status()
-    return resp.json().get('value', [])
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(get_with_retry, url, headers, params)
+        while future is not None:
+            page = future.result().json()
 
+            # The next link already carries the query options of the original request
+            next_link = page.get('@odata.nextLink')
+            future = executor.submit(get_with_retry, next_link, headers) if next_link else None
 
-def iter_cells(table):
-    """Helper function to iterate over all cells in a table."""
-    for row in table.rows:
-        for cell in row.cells:
-            yield cell
+            yield from page.get('value', [])
+
+
+def cell_grid(table):
+    """Materialize all cells of a table as a list of rows, so cells can be indexed without re-walking the XML."""
+    return [list(row.cells) for row in table.rows]
 
 
 def set_table_font_size(table, font_size):
-    """Set the font size for all cells in a table."""
-    for cell in iter_cells(table):
-        for paragraph in cell.text_frame.paragraphs:
-            for run in paragraph.runs:
-                run.font.size = Pt(font_size)
+    """Set the font size (pt) for all runs in a table, working directly on the table XML."""
+    sz = str(Pt(font_size).centipoints)
+    for r in table._tbl.iter(qn('a:r')):
+        r.get_or_add_rPr().set('sz', sz)
 
 
-def create_table(slide, rows, cols, left, top, width, height, font_size, font_bold):
-    """Create a new table and apply formatting."""
+def format_cells(table, font_size, font_bold):
+    """
+    Apply font size (pt) and bold formatting to every run in a table, working directly on the table XML.
+    A font_bold of None removes explicit bold so it is inherited from the table style.
+    """
+    sz = str(Pt(font_size).centipoints)
+    for r in table._tbl.iter(qn('a:r')):
+        rPr = r.get_or_add_rPr()
+        rPr.set('sz', sz)
+        if font_bold is None:
+            rPr.attrib.pop('b', None)
+        else:
+            rPr.set('b', '1' if font_bold else '0')
+
+
+def create_table(slide, rows, cols, left, top, width, height):
+    """Create a new table with the configured table style."""
     new_shape = slide.shapes.add_table(rows, cols, left, top, width, height)
     new_table = new_shape.table
     tbl =  new_shape._element.graphic.graphicData.tbl
     tbl[0][-1].text = PPTX_TABLE_STYLE_ID
 
-    # Apply font size and bold formatting to all cells
-    for cell in iter_cells(new_table):
-        for paragraph in cell.text_frame.paragraphs:
-            for run in paragraph.runs:
-                run.font.size = font_size
-                run.font.bold = font_bold
-
     return new_table
 
 
+def _row_values(items, headers):
+    """Convert table items to rows of cell text in header order, using "" for missing keys."""
+    if len(headers) > 1:
+        get_row = operator.itemgetter(*headers)
+        try:
+            return [list(map(str, get_row(item))) for item in items]
+        except KeyError:
+            pass  # Some items lack a header; fall back to per-key lookups
+    return [[str(item.get(header, "")) for header in headers] for item in items]
+
+
 def process_table_placeholder(table, content, slide):
     """Process a table placeholder and replace it with a new table."""
-    placeholder_name = table.cell(0, 0).text[8:-2].strip()  # Extract placeholder name
+    first_cell = table.cell(0, 0)
+    m = _TABLE_PH_RE.match(first_cell.text)
+    if not m:
+        return
+    placeholder_name = m.group(1)
     #print(f"Found table placeholder: {placeholder_name}")
 
     # Get the array from the JSON content
     value = content.get(placeholder_name, [])
     if not isinstance(value, list) or not value:
         print(f"No valid array found for '{placeholder_name}'")
-        table.cell(0, 0).text = "n/a"
-        set_table_font_size(table, 11)
+        first_cell.text = "n/a"
+        set_table_font_size(table, TABLE_FONT_SIZE)
         return
 
     # Determine headers and table dimensions
     if isinstance(value[0], dict):
-        headers = list(value[0].keys())
+        headers = [sys.intern(header) for header in value[0].keys()]
         rows, cols = len(value) + 1, len(headers)  # +1 for the header row
     else:
         print(f"Invalid array format for '{placeholder_name}'")
@@ -141,101 +251,329 @@ def process_table_placeholder(table, content, slide):
     top = table._graphic_frame.top
     width = table._graphic_frame.width
     height = table._graphic_frame.height
-    font_size = table.cell(0, 0).text_frame.paragraphs[0].font.size
-    font_bold = table.cell(0, 0).text_frame.paragraphs[0].font.bold
-
+    font_bold = first_cell.text_frame.paragraphs[0].font.bold
 
     # Remove the placeholder table
     sp = table._graphic_frame._element
     sp.getparent().remove(sp)
 
     # Create a new table
-    new_table = create_table(slide, rows, cols, left, top, width, height, font_size, font_bold)
+    new_table = create_table(slide, rows, cols, left, top, width, height)
+    row_cells = cell_grid(new_table)
 
     # Insert headers
     for col_idx, header in enumerate(headers):
-        cell = new_table.cell(0, col_idx)
-        cell.text = header
+        row_cells[0][col_idx].text = header
 
     # Insert data rows
-    for row_idx, item in enumerate(value, start=1):
-        for col_idx, header in enumerate(headers):
-            cell = new_table.cell(row_idx, col_idx)
-            cell.text = str(item.get(header, ""))
+    for cells, row in zip(row_cells[1:], _row_values(value, headers)):
+        for cell, text in zip(cells, row):
+            cell.text = text
+
+    # Format all cells in a single pass, now that every cell has its runs
+    format_cells(new_table, TABLE_FONT_SIZE, font_bold)
+
 
-    # Set font size for all cells
-    set_table_font_size(new_table, 11)
+@functools.lru_cache(maxsize=4)
+def _template_bytes(path):
+    """Read a template file once and keep its bytes in memory for repeated loads."""
+    with open(path, 'rb') as f:
+        return f.read()
 
 
-def process_text_placeholders(slide, content):
+# Parsed template presentations, and their compiled text filler and slide metadata, keyed by template bytes
+_template_presentations = {}
+_template_analysis = {}
+
+
+def _fresh_presentation(template_bytes):
+    """
+    Return a fresh, independent Presentation for the template.
+    The template is parsed once per process and deep-copied for each record, which skips
+    re-parsing its XML. If the copy fails, the template is parsed from its bytes instead.
+    The parsed base must never be traversed: python-pptx caches proxies such as
+    Presentation.slides and Slide.shapes that hold sub-elements of the part XML, and
+    deepcopy turns those cached sub-elements into detached trees that are never saved.
     """
-    Update text placeholders in a slide.
-    Replace {{placeholders}} in text elements with corresponding values from the JSON content.
-    If a placeholder is not found in the JSON document, replace it with "n/a".
+    base = _template_presentations.get(template_bytes)
+    if base is None:
+        base = _template_presentations[template_bytes] = Presentation(io.BytesIO(template_bytes))
+    try:
+        return copy.deepcopy(base)
+    except (TypeError, copy.Error) as e:
+        print(f"Could not copy parsed template, parsing it again: {e}")
+        return Presentation(io.BytesIO(template_bytes))
+
+
+def _sp_tree(slide):
+    """
+    Return the shape tree of a slide, read from the slide part's own XML.
+    Unlike the cached slide.shapes proxy, this is always the tree that gets saved.
+    """
+    return slide.part._element.cSld.spTree
+
+
+def _slide_text_elements(slide):
+    """Return one list of run <a:t> elements per text paragraph on the slide."""
+    return [ts for ts in (_T_XPATH(p) for p in _P_XPATH(_sp_tree(slide))) if ts]
+
+
+def _unescape_ctrl_char(match):
+    """Turn an _xHHHH_ escape back into its control character; tab and line feed are never escaped."""
+    char = chr(int(match.group(1), 16))
+    return match.group(0) if char in '\t\n' else char
+
+
+def _run_text(t):
+    """Return the text of a run <a:t> element, un-escaping control characters python-pptx escaped on write."""
+    return _CTRL_ESCAPE_RE.sub(_unescape_ctrl_char, t.text or '')
+
+
+def _set_run_text(t, text):
+    """Set the text of a run <a:t> element, escaping XML-illegal control characters like the _Run.text setter."""
+    t.text = CT_RegularTextRun._escape_ctrl_chars(text)
+
+
+def _element_path(root, element):
+    """Return the child indices leading from root down to element."""
+    path = []
+    while element is not root:
+        parent = element.getparent()
+        path.append(parent.index(element))
+        element = parent
+    return path[::-1]
+
+
+def _resolve_path(root, path):
+    """Return the element reached by following the child indices in path from root."""
+    for idx in path:
+        root = root[idx]
+    return root
+
+
+def _is_table_placeholder(shape):
+    """Return True if the shape is a table whose first cell holds a {{table:NAME}} placeholder."""
+    return shape.has_table and _TABLE_PH_RE.match(shape.table.cell(0, 0).text) is not None
+
+
+def _analyze_template(prs):
+    """
+    Determine which slides of a template contain placeholder tables.
+    Returns one dict per slide with 'has_table_placeholders'.
+    """
+    return [
+        {'has_table_placeholders': any(_is_table_placeholder(shape) for shape in slide.shapes)}
+        for slide in prs.slides
+    ]
+
+
+def compile_template(prs):
+    """
+    Specialize text placeholder filling for a template.
+    Walks the template once and records, for every paragraph containing placeholders, the
+    positions of its run text elements and how its text splits into literal text and
+    placeholder names. Paragraphs and slides without placeholders are left out entirely.
     Args:
-        slide: The slide object to process.
-        content: The JSON content containing placeholder values.
+        prs: The parsed, unmodified template.
+    Returns:
+        A fill(prs, content) function that replaces {{placeholders}} in a fresh copy of the
+        same template with values from content, using "n/a" for missing placeholders.
     """
-    for shape in slide.shapes:
-        if shape.has_text_frame:
-            for paragraph in shape.text_frame.paragraphs:
-                # Concatenate all runs into a single string
-                fulltext = ''.join(run.text for run in paragraph.runs)
-
-                # Replace placeholders in the concatenated text
-                for placeholder_name, value in content.items():
-                    placeholder_tag = f"{{{{{placeholder_name}}}}}"  # Format as {{placeholder}}
-                    if placeholder_tag in fulltext:
-                        #print(f"Replacing placeholder: {placeholder_name}")
-                        fulltext = fulltext.replace(placeholder_tag, str(value))
-
-                # Handle placeholders not found in the JSON document
-                while "{{" in fulltext and "}}" in fulltext:
-                    start_idx = fulltext.find("{{")
-                    end_idx = fulltext.find("}}", start_idx) + 2
-                    placeholder_tag = fulltext[start_idx:end_idx]
-                    #print(f"Replacing missing placeholder: {placeholder_tag} with 'n/a'")
-                    fulltext = fulltext.replace(placeholder_tag, "n/a")
-
-                # Clear all runs and reassign the updated text
-                for run in paragraph.runs:
-                    run.text = ''  # Clear existing text
-                if paragraph.runs:
-                    paragraph.runs[0].text = fulltext  # Assign updated text to the first run
-
-
-def generate_ppt(jobid: str, records: list, template_path='template.pptx', output_filename='output.pptx'):
-    """Populate a PowerPoint template with data records."""
-    prs = Presentation(template_path)
-    jobdate = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    plan = []
+    for slide_idx, slide in enumerate(prs.slides):
+        sp_tree = _sp_tree(slide)
+        for ts in _slide_text_elements(slide):
+            # Alternating literal text and placeholder names, e.g. ['Job ', 'jobid', '']
+            parts = _PLACEHOLDER_RE.split(''.join(_run_text(t) for t in ts))
+            parts[1::2] = [sys.intern(name) for name in parts[1::2]]
+            if len(parts) > 1:
+                plan.append((slide_idx, [_element_path(sp_tree, t) for t in ts], parts))
+
+    def fill(prs, content):
+        """Fill the text placeholders of a fresh copy of the compiled template."""
+        sp_trees = [_sp_tree(slide) for slide in prs.slides]
+        for slide_idx, paths, parts in plan:
+            text = ''.join(
+                part if i % 2 == 0 else str(content.get(part, "n/a"))
+                for i, part in enumerate(parts)
+            )
+
+            # Assign the updated text to the first run and clear the rest
+            ts = [_resolve_path(sp_trees[slide_idx], path) for path in paths]
+            _set_run_text(ts[0], text)
+            for t in ts[1:]:
+                t.text = ''
+
+    return fill
+
+
+def _collect_table_placeholders(slides):
+    """
+    Collect (table, slide) pairs for every placeholder table on the given slides, before any are replaced.
+    Tables without a {{table:NAME}} placeholder are regular tables and are left untouched.
+    """
+    return [
+        (shape.table, slide)
+        for slide in slides
+        for shape in slide.shapes
+        if _is_table_placeholder(shape)
+    ]
+
+
+def _render_one(jobid, jobdate, content, template_bytes):
+    """Render a single record's content into a fresh copy of the template and return the Presentation."""
+    content['jobid'] = jobid
+    content['jobdate'] = jobdate
+
+    prs = _fresh_presentation(template_bytes)
+
+    # Compile and analyze the template on first use, on a separate parse so the base that
+    # gets deep-copied stays untraversed
+    analysis = _template_analysis.get(template_bytes)
+    if analysis is None:
+        base = Presentation(io.BytesIO(template_bytes))
+        analysis = _template_analysis[template_bytes] = (compile_template(base), _analyze_template(base))
+    fill_text, slide_meta = analysis
+
+    # Collect table placeholders before anything is mutated, skipping slides without any
+    table_placeholders = _collect_table_placeholders(
+        slide for slide, meta in zip(prs.slides, slide_meta) if meta['has_table_placeholders']
+    )
+
+    # Update text placeholders
+    fill_text(prs, content)
+
+    # Process table placeholders
+    for table, slide in table_placeholders:
+        process_table_placeholder(table, content, slide)
+
+    return prs
+
 
+# zipfile's own compressor factory and CRC32, restored once no save is using ISA-L
+_zip_get_compressor = zipfile._get_compressor
+_zip_crc32 = zipfile.crc32
+_isal_lock = threading.Lock()
+_isal_saves = 0
+
+
+def _isal_compressor(compress_type, compresslevel=None):
+    """zipfile compressor factory that uses ISA-L for DEFLATE, mapping zlib levels onto ISA-L's 0-3 range."""
+    if compress_type != zipfile.ZIP_DEFLATED:
+        return _zip_get_compressor(compress_type, compresslevel)
+    if compresslevel is None or compresslevel < 0:
+        level = isal_zlib.ISAL_DEFAULT_COMPRESSION
+    else:
+        level = min(compresslevel, isal_zlib.ISAL_BEST_COMPRESSION)
+    return isal_zlib.compressobj(level, zlib.DEFLATED, -15)
+
+
+@contextlib.contextmanager
+def _isal_zip():
+    """
+    Make zipfile use ISA-L's DEFLATE and CRC32 while the block runs, when isal is installed.
+    Concurrent saves share the swap; zipfile is restored when the last one finishes.
+    """
+    global _isal_saves
+    if isal_zlib is None:
+        yield
+        return
+    with _isal_lock:
+        if _isal_saves == 0:
+            zipfile._get_compressor = _isal_compressor
+            zipfile.crc32 = isal_zlib.crc32
+        _isal_saves += 1
+    try:
+        yield
+    finally:
+        with _isal_lock:
+            _isal_saves -= 1
+            if _isal_saves == 0:
+                zipfile._get_compressor = _zip_get_compressor
+                zipfile.crc32 = _zip_crc32
+
+
+def save_presentation(prs, output_file):
+    """Save a presentation, compressing it with ISA-L when isal is installed."""
+    with _isal_zip():
+        prs.save(output_file)
+
+
+def _render_batch(jobid, jobdate, contents, template_bytes, output_files):
+    """
+    Render a batch of records and save each one to the matching path in output_files.
+    Runs in a worker process, so it only takes picklable arguments. Each presentation is
+    saved on a background thread while the next record is rendered.
+    Returns the paths of the generated presentations.
+    """
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=MAX_PENDING_SAVES) as save_pool:
+        for content, output_file in zip(contents, output_files):
+            prs = _render_one(jobid, jobdate, content, template_bytes)
+
+            # Bound the number of rendered presentations held in memory while waiting to be saved
+            if len(pending) >= MAX_PENDING_SAVES:
+                pending.popleft().result()
+            pending.append(save_pool.submit(save_presentation, prs, output_file))
+
+        for future in pending:
+            future.result()
+    return output_files
+
+
+def _parse_records(records):
+    """
+    Decode the JSON content of every record up-front.
+    Returns (idx, content) pairs; records whose content cannot be decoded are reported and skipped.
+    """
+    parsed = []
     for idx, record in enumerate(records):
         content = {}
         if 'jeschro_content' in record:
             try:
-                content = json.loads(record['jeschro_content'])
-            except json.JSONDecodeError as e:
+                content = _json.loads(record['jeschro_content'])
+            except _json.JSONDecodeError as e:
                 print(f"Error decoding JSON for record {idx}: {e}")
                 continue
+        parsed.append((idx, content))
+    return parsed
 
-        content['jobid'] = jobid
-        content['jobdate'] = jobdate
 
-        for slide in prs.slides:
-            # Update text placeholders
-            process_text_placeholders(slide, content)
-
-            # Process table placeholders
-            for shape in slide.shapes:
-                if shape.has_table:
-                    process_table_placeholder(shape.table, content, slide)
+def generate_ppt(jobid: str, records: list, template_path='template.pptx', output_filename='output.pptx', max_workers=MAX_RENDER_WORKERS):
+    """
+    Populate a PowerPoint template with data records.
+    Each record is rendered into a fresh copy of the template and saved as its own
+    presentation. When there is more than one record, the record number is appended
+    to output_filename. Records are rendered in parallel across up to max_workers processes.
+    """
+    jobdate = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    template_bytes = _template_bytes(template_path)
 
-    print(OUTPUT_PATH)    
+    print(OUTPUT_PATH)
     if not os.path.exists(OUTPUT_PATH):
         os.makedirs(OUTPUT_PATH)
 
-    prs.save(os.path.join(OUTPUT_PATH, output_filename))
-    print(f"Generated presentation: {os.path.join(OUTPUT_PATH, output_filename)}")
+    stem, ext = os.path.splitext(output_filename)
+    parsed = _parse_records(records)
+    contents = [content for _, content in parsed]
+    output_files = [
+        os.path.join(OUTPUT_PATH, output_filename if len(records) == 1 else f"{stem}_{idx + 1}{ext}")
+        for idx, _ in parsed
+    ]
+
+    # Split the records round-robin into one batch per worker process
+    workers = max(1, min(max_workers, len(parsed)))
+    content_batches = [contents[i::workers] for i in range(workers)]
+    output_batches = [output_files[i::workers] for i in range(workers)]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        generated = executor.map(
+            _render_batch,
+            repeat(jobid), repeat(jobdate), content_batches, repeat(template_bytes), output_batches
+        )
+        for batch_files in generated:
+            for output_file in batch_files:
+                print(f"Generated presentation: {output_file}")
 
 
 if __name__ == '__main__':
@@ -244,12 +582,12 @@ if __name__ == '__main__':
     #jobid = "d13b4413-f120-f011-9989-7c1e5283aeb9"
     jobid = "10960a97-4621-f011-8c4d-7c1e5283aeb9"
    
-    data = fetch_data(
+    data = list(fetch_data(
         entity=DATAVERSE_ENTITY,
         token=token,
         select=[DATAVERSE_ENTITY_COLUMNS],
         filter_expr="".join([DATAVERSE_ENTITY_FILTER_COLUMN, f" eq '{jobid}'"])
-    )
+    ))
 
     if not data:
         print("No records retrieved.")
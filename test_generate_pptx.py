@@ -0,0 +1,140 @@
+import os
+import json
+
+# generate_pptx exits at import time unless the Dataverse settings are present
+for name in ['DATAVERSE_CLIENT_ID', 'DATAVERSE_CLIENT_SECRET', 'DATAVERSE_TENANT_ID', 'DATAVERSE_URL', 'DATAVERSE_API_URL']:
+    os.environ.setdefault(name, 'https://example.crm.dynamics.com')
+os.environ.setdefault('PPTX_TABLE_STYLE_ID', '{5C22544A-7EE6-4342-B048-85BDC9FD1C3A}')
+
+import httpx
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+import generate_pptx
+
+
+def make_template(path, slides=3):
+    """Create a template where every slide has a text placeholder and a table placeholder."""
+    prs = Presentation()
+    for _ in range(slides):
+        slide = prs.slides.add_slide(prs.slide_layouts[5])
+        slide.shapes.title.text = 'Report {{name}} for {{jobid}}'
+        table = slide.shapes.add_table(1, 1, Inches(1), Inches(2), Inches(4), Inches(1)).table
+        table.cell(0, 0).text = '{{table:items}}'
+    prs.save(path)
+
+
+@pytest.mark.parametrize('max_workers', [1, 3, None], ids=['one-worker', 'three-workers', 'default-pool'])
+def test_every_record_is_filled_when_records_exceed_workers(tmp_path, monkeypatch, max_workers):
+    template = tmp_path / 'template.pptx'
+    make_template(str(template))
+    monkeypatch.setattr(generate_pptx, 'OUTPUT_PATH', str(tmp_path / 'output'))
+
+    # Each worker renders several records from the same parsed template
+    workers = max_workers or generate_pptx.MAX_RENDER_WORKERS
+    count = 2 * workers + 1
+    records = [
+        {'jeschro_content': json.dumps({'name': f'record{i}', 'items': [{'item': f'value{i}'}]})}
+        for i in range(count)
+    ]
+    kwargs = {'max_workers': max_workers} if max_workers else {}
+    generate_pptx.generate_ppt('job1', records, template_path=str(template), output_filename='report.pptx', **kwargs)
+
+    for i in range(count):
+        prs = Presentation(str(tmp_path / 'output' / f'report_{i + 1}.pptx'))
+        for slide in prs.slides:
+            assert slide.shapes.title.text == f'Report record{i} for job1'
+            tables = [shape.table for shape in slide.shapes if shape.has_table]
+            assert len(tables) == 1
+            assert tables[0].cell(0, 0).text == 'item'
+            assert tables[0].cell(1, 0).text == f'value{i}'
+
+
+def render_single(tmp_path, monkeypatch, content):
+    """Render one record with the given content and return the generated presentation."""
+    template = tmp_path / 'template.pptx'
+    make_template(str(template), slides=1)
+    monkeypatch.setattr(generate_pptx, 'OUTPUT_PATH', str(tmp_path / 'output'))
+    records = [{'jeschro_content': json.dumps(content)}]
+    generate_pptx.generate_ppt('job1', records, template_path=str(template), output_filename='report.pptx', max_workers=1)
+    return Presentation(str(tmp_path / 'output' / 'report.pptx'))
+
+
+def test_control_characters_in_values_are_escaped(tmp_path, monkeypatch):
+    prs = render_single(tmp_path, monkeypatch, {'name': 'line\x0bbreak', 'items': []})
+    assert prs.slides[0].shapes.title.text == 'Report line_x000B_break for job1'
+
+
+def mock_dataverse(monkeypatch, handler):
+    """Route Dataverse requests to handler and record the delays requested by the retry loop."""
+    requests = []
+    sleeps = []
+
+    def record(request):
+        requests.append(request)
+        return handler(request, len(requests))
+
+    monkeypatch.setattr(generate_pptx, '_http', httpx.Client(transport=httpx.MockTransport(record)))
+    monkeypatch.setattr(generate_pptx.time, 'sleep', sleeps.append)
+    return requests, sleeps
+
+
+def test_fetch_data_follows_next_link(monkeypatch):
+    def handler(request, n):
+        if n == 1:
+            return httpx.Response(200, json={'value': [{'id': 1}, {'id': 2}], '@odata.nextLink': 'https://example.crm.dynamics.com/accounts?page=2'})
+        return httpx.Response(200, json={'value': [{'id': 3}]})
+
+    requests, sleeps = mock_dataverse(monkeypatch, handler)
+    records = list(generate_pptx.fetch_data('accounts', 'token', select=['id'], filter_expr="id eq 1"))
+
+    assert records == [{'id': 1}, {'id': 2}, {'id': 3}]
+    assert requests[0].url.params['$select'] == 'id'
+    assert requests[0].url.params['$filter'] == 'id eq 1'
+    assert str(requests[1].url) == 'https://example.crm.dynamics.com/accounts?page=2'
+    assert all(r.headers['Authorization'] == 'Bearer token' for r in requests)
+    assert sleeps == []
+
+
+def test_fetch_data_retries_throttled_page(monkeypatch):
+    def handler(request, n):
+        if n == 1:
+            return httpx.Response(429, headers={'Retry-After': '2'})
+        return httpx.Response(200, json={'value': [{'id': 1}]})
+
+    requests, sleeps = mock_dataverse(monkeypatch, handler)
+    records = list(generate_pptx.fetch_data('accounts', 'token'))
+
+    assert records == [{'id': 1}]
+    assert len(requests) == 2
+    assert len(sleeps) == 1 and 2 <= sleeps[0] <= 2.5
+
+
+def test_fetch_data_gives_up_after_max_attempts(monkeypatch):
+    def handler(request, n):
+        return httpx.Response(503, headers={'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+
+    requests, sleeps = mock_dataverse(monkeypatch, handler)
+    with pytest.raises(httpx.HTTPStatusError):
+        list(generate_pptx.fetch_data('accounts', 'token'))
+
+    assert len(requests) == generate_pptx.MAX_REQUEST_ATTEMPTS
+    assert len(sleeps) == generate_pptx.MAX_REQUEST_ATTEMPTS - 1
+
+
+def table_text(prs):
+    """Return the cell text of the single table on the first slide, row by row."""
+    table = next(shape.table for shape in prs.slides[0].shapes if shape.has_table)
+    return [[cell.text for cell in row.cells] for row in table.rows]
+
+
+def test_table_placeholder_with_one_header(tmp_path, monkeypatch):
+    prs = render_single(tmp_path, monkeypatch, {'name': 'x', 'items': [{'item': 'first'}, {'item': 2}]})
+    assert table_text(prs) == [['item'], ['first'], ['2']]
+
+
+def test_table_placeholder_fills_missing_keys_with_empty_text(tmp_path, monkeypatch):
+    items = [{'item': 'first', 'qty': 1}, {'item': 'second'}, {'qty': 3}]
+    prs = render_single(tmp_path, monkeypatch, {'name': 'x', 'items': items})
+    assert table_text(prs) == [['item', 'qty'], ['first', '1'], ['second', ''], ['', '3']]